@@ -1,5 +1,23 @@
-from .client import BinanceClient
-from .orders import OrderManager
-from .validators import validate_order_params
+"""Trading bot package.
 
-__all__ = ['BinanceClient', 'OrderManager', 'validate_order_params']
+Re-exports are resolved lazily (PEP 562) so that importing a light
+submodule such as bot.logging_config does not drag in the client stack
+(requests, urllib3, OpenSSL bindings) at package import time.
+"""
+
+__all__ = ['BinanceClient', 'BinanceAsyncClient', 'OrderManager', 'validate_order_params']
+
+_EXPORTS = {
+    'BinanceClient': 'client',
+    'BinanceAsyncClient': 'client',
+    'OrderManager': 'orders',
+    'validate_order_params': 'validators',
+}
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    return getattr(import_module(f'.{module_name}', __name__), name)
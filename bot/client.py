@@ -1,11 +1,54 @@
+import binascii
 import hashlib
 import hmac
+import logging
 import time
 import requests
-from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # 2-5x faster than stdlib json on the large exchangeInfo payloads;
+    # optional, the stdlib parser is used when it isn't installed.
+    import orjson
+except ImportError:
+    orjson = None
 
 from .logging_config import get_logger
 
+# Shared connection pool for all clients. The bot only ever talks to one
+# host, so a single warm pool with keep-alive avoids paying the TCP+TLS
+# handshake (~300-400 ms) on every request after the first. Transient
+# gateway/rate-limit responses are retried with a short backoff.
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.1,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'POST', 'DELETE'])
+    )
+)
+
+
+# Compiled query serializers keyed by the tuple of param names. Requests
+# reuse a handful of fixed key shapes (order placement, cancel, price
+# lookup...), so each shape's serializer is generated once as a single
+# f-string and reused for every later request with the same keys.
+_QUERY_FORMATTERS = {}
+
+
+def _query_formatter(keys):
+    """Get or compile the query-bytes serializer for a param key shape."""
+    fmt = _QUERY_FORMATTERS.get(keys)
+    if fmt is None:
+        template = '&'.join(f"{k}={{p['{k}']}}" for k in keys)
+        namespace = {}
+        exec(f'def _fmt(p): return f"{template}".encode("ascii")', namespace)
+        fmt = _QUERY_FORMATTERS[keys] = namespace['_fmt']
+    return fmt
+
 
 class BinanceAPIError(Exception):
     """Exception for Binance API errors."""
@@ -16,43 +59,97 @@ class BinanceAPIError(Exception):
         super().__init__(f"API Error {error_code}: {message}")
 
 
-class BinanceClient:
+class _BaseClient:
     """
-    Binance Futures Testnet API client.
-    
-    Handles authentication, request signing, and API communication.
+    Shared credential handling and request signing.
+
+    Base for the sync (requests) and async (httpx) clients so both sign
+    requests identically.
     """
-    
+
     BASE_URL = "https://testnet.binancefuture.com"
-    
-    def __init__(self, api_key, api_secret):
+
+    def __init__(self, api_key, api_secret, logger_name='client'):
         if not api_key or not api_secret:
             raise ValueError("API key and secret are required")
-        
+
         self.api_key = api_key
         self.api_secret = api_secret
-        self.logger = get_logger('client')
-        
-        self.session = requests.Session()
-        self.session.headers.update({
-            'X-MBX-APIKEY': self.api_key,
-            'Content-Type': 'application/x-www-form-urlencoded'
-        })
-    
-    def _generate_signature(self, params):
-        """Generate HMAC SHA256 signature for request."""
-        query_string = urlencode(params)
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+        self._api_secret_bytes = api_secret.encode('utf-8')
+        # Pre-keyed HMAC context: the expensive key schedule (ipad/opad
+        # XOR plus two SHA-256 init compressions) runs once here; each
+        # signature then works on an O(1) copy of this state.
+        self._hmac_template = hmac.new(self._api_secret_bytes, b'', hashlib.sha256)
+        self.logger = get_logger(logger_name)
+
+    def _encode_params(self, params):
+        """
+        Serialize params to wire-format query bytes.
+
+        Binance request fields (symbol, side, type, quantity, price,
+        timestamp, ...) are plain ASCII and never need percent-quoting,
+        so the whole query is produced by one compiled f-string per
+        param shape (see _query_formatter) and the same bytes feed both
+        the signature and the request body.
+        """
+        return _query_formatter(tuple(params))(params)
+
+    def _generate_signature(self, query_bytes):
+        """Generate the raw HMAC SHA256 digest for the query bytes."""
+        h = self._hmac_template.copy()
+        h.update(query_bytes)
+        return h.digest()
     
     def _get_timestamp(self):
         """Get current timestamp in milliseconds."""
         return int(time.time() * 1000)
-    
+
+    def _order_params(self, symbol, side, order_type, quantity, price=None,
+                      time_in_force=None, reduce_only=False):
+        """Build the request params for a new order."""
+        params = {
+            'symbol': symbol,
+            'side': side,
+            'type': order_type,
+            'quantity': quantity,
+        }
+
+        if order_type == 'LIMIT':
+            if price is None:
+                raise ValueError("Price required for LIMIT orders")
+            params['price'] = price
+            params['timeInForce'] = time_in_force or 'GTC'
+
+        if reduce_only:
+            params['reduceOnly'] = 'true'
+
+        return params
+
+
+class BinanceClient(_BaseClient):
+    """
+    Binance Futures Testnet API client.
+
+    Handles authentication, request signing, and API communication.
+    """
+
+    # Cache TTLs in seconds for read-only endpoints: exchange metadata
+    # changes rarely, ticker prices go stale within about a second.
+    EXCHANGE_INFO_TTL = 3600
+    PRICE_TTL = 1.0
+
+    def __init__(self, api_key, api_secret):
+        super().__init__(api_key, api_secret)
+
+        self._cache = {}
+        self.session = requests.Session()
+        self.session.mount('https://', _ADAPTER)
+        self.session.headers.update({
+            'X-MBX-APIKEY': self.api_key,
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'Connection': 'keep-alive'
+        })
+
     def _make_request(self, method, endpoint, params=None, signed=False):
         """
         Make HTTP request to Binance API.
@@ -68,65 +165,83 @@ class BinanceClient:
         """
         url = f"{self.BASE_URL}{endpoint}"
         params = params or {}
-        
+
         if signed:
             params['timestamp'] = self._get_timestamp()
-            params['signature'] = self._generate_signature(params)
-        
-        self.logger.debug(f"Request: {method} {endpoint}")
-        self.logger.debug(f"Params: {self._sanitize_params(params)}")
-        
+            query = self._encode_params(params)
+            signature = binascii.hexlify(self._generate_signature(query))
+            payload = query + b'&signature=' + signature
+        else:
+            payload = params
+
+        # %-style args defer formatting until a handler actually emits;
+        # any signature in the message is masked handler-side by the
+        # RedactFilter in logging_config.
+        self.logger.debug("Request: %s %s", method, endpoint)
+        self.logger.debug("Params: %s", params)
+
         try:
             if method == 'GET':
-                response = self.session.get(url, params=params, timeout=30)
+                response = self.session.get(url, params=payload, timeout=30)
             elif method == 'POST':
-                response = self.session.post(url, data=params, timeout=30)
+                response = self.session.post(url, data=payload, timeout=30)
             elif method == 'DELETE':
-                response = self.session.delete(url, params=params, timeout=30)
+                response = self.session.delete(url, params=payload, timeout=30)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
-            self.logger.debug(f"Response status: {response.status_code}")
+            self.logger.debug("Response status: %s", response.status_code)
             
             try:
-                data = response.json()
+                data = orjson.loads(response.content) if orjson else response.json()
             except ValueError as e:
-                self.logger.error(f"Invalid JSON response: {e}")
+                self.logger.error("Invalid JSON response: %s", e)
                 raise BinanceAPIError(response.status_code, 'INVALID_JSON', 'Invalid JSON response from server')
             
             if response.status_code != 200:
                 error_code = data.get('code', 'UNKNOWN')
                 error_msg = data.get('msg', 'Unknown error')
-                self.logger.error(f"API error: {error_code} - {error_msg}")
+                self.logger.error("API error: %s - %s", error_code, error_msg)
                 raise BinanceAPIError(response.status_code, error_code, error_msg)
             
-            self.logger.debug(f"Response data: {data}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Response data: %s", data)
             return data
             
         except requests.exceptions.Timeout:
             self.logger.error("Request timeout")
             raise BinanceAPIError(0, 'TIMEOUT', 'Request timed out')
         except requests.exceptions.ConnectionError as e:
-            self.logger.error(f"Connection error: {e}")
+            self.logger.error("Connection error: %s", e)
             raise BinanceAPIError(0, 'CONNECTION_ERROR', str(e))
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"Request failed: {e}")
+            self.logger.error("Request failed: %s", e)
             raise BinanceAPIError(0, 'REQUEST_ERROR', str(e))
-    
-    def _sanitize_params(self, params):
-        """Remove sensitive data from params for logging."""
-        sanitized = params.copy()
-        if 'signature' in sanitized:
-            sanitized['signature'] = '***'
-        return sanitized
-    
+
+    def _cached_get(self, endpoint, params=None, ttl=0):
+        """
+        GET with an in-process TTL cache.
+
+        Repeated reads of slow-moving data within the TTL are served
+        from memory instead of paying a network round-trip.
+        """
+        key = (endpoint, frozenset(params.items()) if params else None)
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and now - entry[0] < ttl:
+            return entry[1]
+
+        data = self._make_request('GET', endpoint, params=params)
+        self._cache[key] = (now, data)
+        return data
+
     def get_server_time(self):
         """Get Binance server time."""
         return self._make_request('GET', '/fapi/v1/time')
-    
+
     def get_exchange_info(self):
         """Get exchange trading rules and symbol info."""
-        return self._make_request('GET', '/fapi/v1/exchangeInfo')
+        return self._cached_get('/fapi/v1/exchangeInfo', ttl=self.EXCHANGE_INFO_TTL)
     
     def get_account_info(self):
         """Get current account information."""
@@ -135,9 +250,9 @@ class BinanceClient:
     def get_symbol_price(self, symbol):
         """Get current price for a symbol."""
         params = {'symbol': symbol}
-        return self._make_request('GET', '/fapi/v1/ticker/price', params=params)
-    
-    def place_order(self, symbol, side, order_type, quantity, price=None, 
+        return self._cached_get('/fapi/v1/ticker/price', params=params, ttl=self.PRICE_TTL)
+
+    def place_order(self, symbol, side, order_type, quantity, price=None,
                     time_in_force=None, reduce_only=False):
         """
         Place a new order.
@@ -154,26 +269,37 @@ class BinanceClient:
         Returns:
             Order response from API
         """
-        params = {
-            'symbol': symbol,
-            'side': side,
-            'type': order_type,
-            'quantity': quantity,
-        }
-        
-        if order_type == 'LIMIT':
-            if price is None:
-                raise ValueError("Price required for LIMIT orders")
-            params['price'] = price
-            params['timeInForce'] = time_in_force or 'GTC'
-        
-        if reduce_only:
-            params['reduceOnly'] = 'true'
-        
-        self.logger.info(f"Placing {order_type} {side} order for {quantity} {symbol}")
-        
+        params = self._order_params(symbol, side, order_type, quantity,
+                                    price, time_in_force, reduce_only)
+
+        self.logger.info("Placing %s %s order for %s %s", order_type, side, quantity, symbol)
+
         return self._make_request('POST', '/fapi/v1/order', params=params, signed=True)
-    
+
+    def place_orders(self, orders):
+        """
+        Place multiple orders over the shared connection.
+
+        Each entry is a dict of place_order keyword arguments. Binance
+        requires an independent signature per order, but the pre-keyed
+        HMAC template keeps the per-order signing cost to a state copy
+        plus one compress — no key schedule is rebuilt inside the loop.
+        A failed order does not abort the batch; its BinanceAPIError is
+        returned in place of the response.
+
+        Returns:
+            List with one entry per order: the API response dict on
+            success, or the BinanceAPIError on failure.
+        """
+        results = []
+        for order in orders:
+            try:
+                results.append(self.place_order(**order))
+            except BinanceAPIError as e:
+                self.logger.error("Batch order failed: %s", e)
+                results.append(e)
+        return results
+
     def cancel_order(self, symbol, order_id):
         """Cancel an existing order."""
         params = {
@@ -196,3 +322,152 @@ class BinanceClient:
             return True
         except Exception:
             return False
+
+    def close(self):
+        """Release the session's pooled connections."""
+        self.session.close()
+
+
+class BinanceAsyncClient(_BaseClient):
+    """
+    Async Binance Futures Testnet API client.
+
+    Mirrors BinanceClient but exposes awaitable methods, so independent
+    calls (batch orders, multi-symbol polling) can run concurrently with
+    asyncio.gather instead of paying one network round-trip each in
+    sequence. Requires the optional httpx dependency.
+    """
+
+    def __init__(self, api_key, api_secret):
+        super().__init__(api_key, api_secret, logger_name='async_client')
+
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "BinanceAsyncClient requires the httpx package "
+                "(pip install 'httpx[http2]')"
+            )
+
+        self._httpx = httpx
+        self._client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            timeout=30,
+            headers={
+                'X-MBX-APIKEY': self.api_key,
+                'Content-Type': 'application/x-www-form-urlencoded'
+            }
+        )
+
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def _make_request(self, method, endpoint, params=None, signed=False):
+        """
+        Make an async HTTP request to Binance API.
+
+        Same contract as BinanceClient._make_request, but awaitable.
+        """
+        url = f"{self.BASE_URL}{endpoint}"
+        params = params or {}
+
+        if signed:
+            params['timestamp'] = self._get_timestamp()
+            query = self._encode_params(params)
+            signature = binascii.hexlify(self._generate_signature(query))
+            payload = query + b'&signature=' + signature
+        else:
+            payload = self._encode_params(params) if params else b''
+
+        self.logger.debug("Request: %s %s", method, endpoint)
+        self.logger.debug("Params: %s", params)
+
+        try:
+            if method == 'POST':
+                response = await self._client.request(method, url, content=payload)
+            else:
+                if payload:
+                    url = f"{url}?{payload.decode('ascii')}"
+                response = await self._client.request(method, url)
+
+            self.logger.debug("Response status: %s", response.status_code)
+
+            try:
+                data = orjson.loads(response.content) if orjson else response.json()
+            except ValueError as e:
+                self.logger.error("Invalid JSON response: %s", e)
+                raise BinanceAPIError(response.status_code, 'INVALID_JSON', 'Invalid JSON response from server')
+
+            if response.status_code != 200:
+                error_code = data.get('code', 'UNKNOWN')
+                error_msg = data.get('msg', 'Unknown error')
+                self.logger.error("API error: %s - %s", error_code, error_msg)
+                raise BinanceAPIError(response.status_code, error_code, error_msg)
+
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Response data: %s", data)
+            return data
+
+        except self._httpx.TimeoutException:
+            self.logger.error("Request timeout")
+            raise BinanceAPIError(0, 'TIMEOUT', 'Request timed out')
+        except self._httpx.ConnectError as e:
+            self.logger.error("Connection error: %s", e)
+            raise BinanceAPIError(0, 'CONNECTION_ERROR', str(e))
+        except self._httpx.HTTPError as e:
+            self.logger.error("Request failed: %s", e)
+            raise BinanceAPIError(0, 'REQUEST_ERROR', str(e))
+
+    async def get_server_time(self):
+        """Get Binance server time."""
+        return await self._make_request('GET', '/fapi/v1/time')
+
+    async def get_account_info(self):
+        """Get current account information."""
+        return await self._make_request('GET', '/fapi/v2/account', signed=True)
+
+    async def get_symbol_price(self, symbol):
+        """Get current price for a symbol."""
+        params = {'symbol': symbol}
+        return await self._make_request('GET', '/fapi/v1/ticker/price', params=params)
+
+    async def place_order(self, symbol, side, order_type, quantity, price=None,
+                          time_in_force=None, reduce_only=False):
+        """Place a new order. Same contract as BinanceClient.place_order."""
+        params = self._order_params(symbol, side, order_type, quantity,
+                                    price, time_in_force, reduce_only)
+
+        self.logger.info("Placing %s %s order for %s %s", order_type, side, quantity, symbol)
+
+        return await self._make_request('POST', '/fapi/v1/order', params=params, signed=True)
+
+    async def cancel_order(self, symbol, order_id):
+        """Cancel an existing order."""
+        params = {
+            'symbol': symbol,
+            'orderId': order_id
+        }
+        return await self._make_request('DELETE', '/fapi/v1/order', params=params, signed=True)
+
+    async def get_open_orders(self, symbol=None):
+        """Get all open orders."""
+        params = {}
+        if symbol:
+            params['symbol'] = symbol
+        return await self._make_request('GET', '/fapi/v1/openOrders', params=params, signed=True)
+
+    async def test_connectivity(self):
+        """Test API connectivity."""
+        try:
+            await self.get_server_time()
+            return True
+        except Exception:
+            return False
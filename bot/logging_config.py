@@ -1,7 +1,31 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import re
 from datetime import datetime
 
+_SIGNATURE_RE = re.compile(r"(signature['\"]?\s*[=:]\s*['\"]?)[0-9a-fA-F]+")
+
+
+class RedactFilter(logging.Filter):
+    """
+    Mask request signatures in emitted log records.
+
+    Runs on the handler, so the redaction (and the message formatting it
+    requires) only happens for records that are actually written out —
+    callers log raw params without paying for a sanitizing copy.
+    """
+
+    def filter(self, record):
+        message = record.getMessage()
+        if 'signature' in message:
+            record.msg = _SIGNATURE_RE.sub(r'\1***', message)
+            record.args = None
+        return True
+
+
 def setup_logging():
     """Configure logging for the trading bot."""
     
@@ -18,6 +42,7 @@ def setup_logging():
     
     file_handler = logging.FileHandler(log_file)
     file_handler.setLevel(logging.DEBUG)
+    file_handler.addFilter(RedactFilter())
     
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
@@ -30,10 +55,22 @@ def setup_logging():
     
     file_handler.setFormatter(file_format)
     console_handler.setFormatter(console_format)
-    
-    logger.addHandler(file_handler)
+
+    # File writes go through a queue so callers on the trading hot path
+    # only pay an enqueue; the disk write happens on a background
+    # thread. The console handler stays synchronous — stderr is fast and
+    # immediate output matters when debugging interactively.
+    log_queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger.addHandler(queue_handler)
     logger.addHandler(console_handler)
-    
+
     return logger
 
 
@@ -2,6 +2,25 @@ from .client import BinanceClient, BinanceAPIError
 from .validators import validate_order_params, ValidationError
 from .logging_config import get_logger
 
+# (output key, API response key) pairs for _format_order_response,
+# precompiled once so formatting is a single comprehension pass.
+_RESPONSE_FIELDS = (
+    ('order_id', 'orderId'),
+    ('symbol', 'symbol'),
+    ('side', 'side'),
+    ('type', 'type'),
+    ('status', 'status'),
+    ('quantity', 'origQty'),
+    ('executed_qty', 'executedQty'),
+    ('price', 'price'),
+    ('avg_price', 'avgPrice'),
+    ('time_in_force', 'timeInForce'),
+    ('reduce_only', 'reduceOnly'),
+    ('timestamp', 'updateTime'),
+)
+
+_SEP = "=" * 50
+
 
 class OrderManager:
     """
@@ -78,60 +97,100 @@ class OrderManager:
                 'error_type': 'UNKNOWN_ERROR'
             }
     
+    async def place_order_async(self, symbol, side, order_type, quantity, price=None):
+        """
+        Async variant of place_order for use with BinanceAsyncClient.
+
+        Validation and the result dict are identical to place_order; the
+        API call is awaited, so several orders can be placed concurrently
+        with asyncio.gather.
+        """
+        try:
+            validated = validate_order_params(symbol, side, order_type, quantity, price)
+        except ValidationError as e:
+            self.logger.error(f"Validation failed: {e}")
+            return {
+                'success': False,
+                'error': str(e),
+                'error_type': 'VALIDATION_ERROR'
+            }
+
+        self.logger.info(f"Order request: {validated}")
+
+        try:
+            response = await self.client.place_order(
+                symbol=validated['symbol'],
+                side=validated['side'],
+                order_type=validated['order_type'],
+                quantity=validated['quantity'],
+                price=validated['price']
+            )
+
+            result = self._format_order_response(response)
+            result['success'] = True
+
+            self.logger.info(f"Order placed successfully: {result['order_id']}")
+
+            return result
+
+        except BinanceAPIError as e:
+            self.logger.error(f"Order failed: {e}")
+            return {
+                'success': False,
+                'error': e.message,
+                'error_code': e.error_code,
+                'error_type': 'API_ERROR'
+            }
+        except Exception as e:
+            self.logger.error(f"Unexpected error: {e}")
+            return {
+                'success': False,
+                'error': str(e),
+                'error_type': 'UNKNOWN_ERROR'
+            }
+
     def _format_order_response(self, response):
         """Format API response into clean output."""
-        return {
-            'order_id': response.get('orderId'),
-            'symbol': response.get('symbol'),
-            'side': response.get('side'),
-            'type': response.get('type'),
-            'status': response.get('status'),
-            'quantity': response.get('origQty'),
-            'executed_qty': response.get('executedQty'),
-            'price': response.get('price'),
-            'avg_price': response.get('avgPrice'),
-            'time_in_force': response.get('timeInForce'),
-            'reduce_only': response.get('reduceOnly'),
-            'timestamp': response.get('updateTime'),
-            'raw_response': response
-        }
+        get = response.get
+        result = {out_key: get(api_key) for out_key, api_key in _RESPONSE_FIELDS}
+        result['raw_response'] = response
+        return result
     
     def get_order_summary(self, order_result):
         """Generate human-readable order summary."""
-        if not order_result.get('success'):
-            error_lines = [
-                "=" * 50,
-                "ORDER FAILED",
-                "=" * 50,
-                f"Error: {order_result.get('error')}",
-            ]
-            if order_result.get('error_code'):
-                error_lines.insert(3, f"Code:  {order_result.get('error_code')}")
-            error_lines.append("=" * 50)
-            return "\n".join(error_lines)
-        
-        lines = [
-            "=" * 50,
-            "ORDER EXECUTED SUCCESSFULLY",
-            "=" * 50,
-            f"Order ID:     {order_result.get('order_id')}",
-            f"Symbol:       {order_result.get('symbol')}",
-            f"Side:         {order_result.get('side')}",
-            f"Type:         {order_result.get('type')}",
-            f"Status:       {order_result.get('status')}",
-            f"Quantity:     {order_result.get('quantity')}",
-            f"Executed:     {order_result.get('executed_qty')}",
-        ]
-        
-        if order_result.get('price') and order_result.get('price') != '0':
-            lines.append(f"Price:        {order_result.get('price')}")
-        
-        if order_result.get('avg_price') and order_result.get('avg_price') != '0':
-            lines.append(f"Avg Price:    {order_result.get('avg_price')}")
-        
-        lines.append("=" * 50)
-        
-        return "\n".join(lines)
+        get = order_result.get
+
+        if not get('success'):
+            code = get('error_code')
+            code_line = f"Code:  {code}\n" if code else ""
+            return (
+                f"{_SEP}\n"
+                "ORDER FAILED\n"
+                f"{_SEP}\n"
+                f"{code_line}"
+                f"Error: {get('error')}\n"
+                f"{_SEP}"
+            )
+
+        price = get('price')
+        avg_price = get('avg_price')
+        price_line = f"\nPrice:        {price}" if price and price != '0' else ""
+        avg_line = f"\nAvg Price:    {avg_price}" if avg_price and avg_price != '0' else ""
+
+        return (
+            f"{_SEP}\n"
+            "ORDER EXECUTED SUCCESSFULLY\n"
+            f"{_SEP}\n"
+            f"Order ID:     {get('order_id')}\n"
+            f"Symbol:       {get('symbol')}\n"
+            f"Side:         {get('side')}\n"
+            f"Type:         {get('type')}\n"
+            f"Status:       {get('status')}\n"
+            f"Quantity:     {get('quantity')}\n"
+            f"Executed:     {get('executed_qty')}"
+            f"{price_line}{avg_line}\n"
+            f"{_SEP}"
+        )
     
     def cancel_order(self, symbol, order_id):
         """Cancel an existing order."""
@@ -26,6 +26,14 @@ def format_quantity(quantity, decimals=8):
     if quantity is None:
         return None
     try:
-        return f"{float(quantity):.{decimals}f}".rstrip('0').rstrip('.')
+        s = f"{float(quantity):.{decimals}f}"
     except (ValueError, TypeError):
         return str(quantity)
+    # Trim trailing zeros (and a bare '.') with one slice instead of the
+    # two scan-and-copy passes rstrip('0').rstrip('.') would make.
+    end = len(s)
+    while end > 1 and s[end - 1] == '0':
+        end -= 1
+    if end > 1 and s[end - 1] == '.':
+        end -= 1
+    return s[:end]
@@ -1,12 +1,15 @@
+import math
 from decimal import Decimal, InvalidOperation
 
-VALID_SYMBOLS = [
+# frozenset: O(1) hashed membership instead of a linear list scan, which
+# matters when validating large order batches.
+VALID_SYMBOLS = frozenset((
     'BTCUSDT', 'ETHUSDT', 'BNBUSDT', 'XRPUSDT', 'DOGEUSDT',
     'ADAUSDT', 'SOLUSDT', 'DOTUSDT', 'MATICUSDT', 'LTCUSDT'
-]
+))
 
-VALID_SIDES = ['BUY', 'SELL']
-VALID_ORDER_TYPES = ['MARKET', 'LIMIT']
+VALID_SIDES = frozenset(('BUY', 'SELL'))
+VALID_ORDER_TYPES = frozenset(('MARKET', 'LIMIT'))
 
 
 class ValidationError(Exception):
@@ -18,9 +21,13 @@ def validate_symbol(symbol):
     """Validate trading symbol."""
     if not symbol:
         raise ValidationError("Symbol is required")
-    
+
+    # Fast path: already-canonical input skips the normalization.
+    if symbol in VALID_SYMBOLS:
+        return symbol
+
     symbol = symbol.upper().strip()
-    
+
     if not symbol.endswith('USDT'):
         raise ValidationError(f"Invalid symbol format: {symbol}. Must end with USDT")
     
@@ -31,7 +38,10 @@ def validate_side(side):
     """Validate order side."""
     if not side:
         raise ValidationError("Side is required")
-    
+
+    if side in VALID_SIDES:
+        return side
+
     side = side.upper().strip()
     
     if side not in VALID_SIDES:
@@ -44,7 +54,10 @@ def validate_order_type(order_type):
     """Validate order type."""
     if not order_type:
         raise ValidationError("Order type is required")
-    
+
+    if order_type in VALID_ORDER_TYPES:
+        return order_type
+
     order_type = order_type.upper().strip()
     
     if order_type not in VALID_ORDER_TYPES:
@@ -57,15 +70,28 @@ def validate_quantity(quantity):
     """Validate order quantity."""
     if quantity is None:
         raise ValidationError("Quantity is required")
-    
+
+    # Fast path: CLI and API callers pass plain floats/ints, which don't
+    # need the (much slower) Decimal round-trip. Strings still go
+    # through Decimal so odd inputs are parsed strictly.
+    if isinstance(quantity, (int, float)):
+        if not math.isfinite(quantity):
+            raise ValidationError(f"Invalid quantity: {quantity}")
+        if quantity <= 0:
+            raise ValidationError("Quantity must be greater than 0")
+        return float(quantity)
+
     try:
         qty = Decimal(str(quantity))
     except (InvalidOperation, ValueError):
         raise ValidationError(f"Invalid quantity: {quantity}")
-    
+
+    if qty.is_nan() or not qty.is_finite():
+        raise ValidationError(f"Invalid quantity: {quantity}")
+
     if qty <= 0:
         raise ValidationError("Quantity must be greater than 0")
-    
+
     return float(qty)
 
 
@@ -74,17 +100,27 @@ def validate_price(price, order_type):
     if order_type == 'LIMIT':
         if price is None:
             raise ValidationError("Price is required for LIMIT orders")
-        
+
+        if isinstance(price, (int, float)):
+            if not math.isfinite(price):
+                raise ValidationError(f"Invalid price: {price}")
+            if price <= 0:
+                raise ValidationError("Price must be greater than 0")
+            return float(price)
+
         try:
             p = Decimal(str(price))
         except (InvalidOperation, ValueError):
             raise ValidationError(f"Invalid price: {price}")
-        
+
+        if p.is_nan() or not p.is_finite():
+            raise ValidationError(f"Invalid price: {price}")
+
         if p <= 0:
             raise ValidationError("Price must be greater than 0")
-        
+
         return float(p)
-    
+
     return None
 
 
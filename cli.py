@@ -5,21 +5,33 @@ Binance Futures Testnet Trading Bot CLI
 Usage:
     python cli.py --symbol BTCUSDT --side BUY --type MARKET --quantity 0.001
     python cli.py --symbol BTCUSDT --side SELL --type LIMIT --quantity 0.001 --price 50000
+    python cli.py --batch orders.txt
 """
 
 import argparse
+import asyncio
+import functools
 import os
 import sys
-from dotenv import load_dotenv
 
 from bot.logging_config import setup_logging, get_logger
-from bot.client import BinanceClient, BinanceAPIError
-from bot.orders import OrderManager
-from bot.validators import ValidationError
 
+# dotenv and the bot client/order modules (which pull in requests and
+# urllib3) are imported lazily inside the functions that need them, so
+# fast exits like --help don't pay their cold-start cost.
 
+
+@functools.cache
 def load_config():
-    """Load API credentials from environment."""
+    """
+    Load API credentials from environment.
+
+    Cached so the .env file is parsed at most once per process; callers
+    embedding the bot in a long-running service can call this freely.
+    Use load_config.cache_clear() to force a re-read (e.g. in tests).
+    """
+    from dotenv import load_dotenv
+
     load_dotenv()
     
     api_key = os.getenv('BINANCE_TESTNET_API_KEY')
@@ -46,55 +58,116 @@ Examples:
   
   Limit sell order:
     python cli.py --symbol BTCUSDT --side SELL --type LIMIT --quantity 0.001 --price 100000
+
+  Batch orders (one per line: SYMBOL SIDE TYPE QUANTITY [PRICE]):
+    python cli.py --batch orders.txt
         """
     )
-    
+
+    # type=str.upper normalizes once at parse time, so downstream layers
+    # (summary printing, OrderManager, validators) see canonical values
+    # and hit their fast paths instead of re-uppercasing per call.
     parser.add_argument(
         '--symbol', '-s',
-        required=True,
+        type=str.upper,
         help='Trading pair (e.g., BTCUSDT)'
     )
-    
+
     parser.add_argument(
         '--side',
-        required=True,
-        choices=['BUY', 'SELL', 'buy', 'sell'],
+        type=str.upper,
+        choices=['BUY', 'SELL'],
         help='Order side: BUY or SELL'
     )
-    
+
     parser.add_argument(
         '--type', '-t',
-        required=True,
-        choices=['MARKET', 'LIMIT', 'market', 'limit'],
+        type=str.upper,
+        choices=['MARKET', 'LIMIT'],
         dest='order_type',
         help='Order type: MARKET or LIMIT'
     )
-    
+
     parser.add_argument(
         '--quantity', '-q',
-        required=True,
         type=float,
         help='Order quantity'
     )
-    
+
     parser.add_argument(
         '--price', '-p',
         type=float,
         default=None,
         help='Limit price (required for LIMIT orders)'
     )
-    
+
+    parser.add_argument(
+        '--batch', '-b',
+        metavar='FILE',
+        default=None,
+        help='Place all orders from FILE concurrently '
+             '(one per line: SYMBOL SIDE TYPE QUANTITY [PRICE])'
+    )
+
     return parser
 
 
+def parse_batch_file(path):
+    """Parse a batch order file into a list of order kwargs."""
+    orders = []
+
+    with open(path) as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+
+            parts = line.split()
+            if len(parts) not in (4, 5):
+                print(f"Error: {path}:{lineno}: expected "
+                      f"'SYMBOL SIDE TYPE QUANTITY [PRICE]', got: {line}")
+                sys.exit(1)
+
+            orders.append({
+                'symbol': parts[0],
+                'side': parts[1],
+                'order_type': parts[2],
+                'quantity': parts[3],
+                'price': parts[4] if len(parts) == 5 else None,
+            })
+
+    if not orders:
+        print(f"Error: no orders found in {path}")
+        sys.exit(1)
+
+    return orders
+
+
+async def run_batch(orders, api_key, api_secret):
+    """Place all orders concurrently over a single async client."""
+    from bot.client import BinanceAsyncClient
+    from bot.orders import OrderManager
+
+    async with BinanceAsyncClient(api_key, api_secret) as client:
+        order_manager = OrderManager(client)
+        results = await asyncio.gather(*(
+            order_manager.place_order_async(**order) for order in orders
+        ))
+
+    for result in results:
+        print(order_manager.get_order_summary(result))
+
+    return all(result.get('success') for result in results)
+
+
 def print_request_summary(args):
     """Print order request summary."""
     print("\n" + "=" * 50)
     print("ORDER REQUEST")
     print("=" * 50)
-    print(f"Symbol:       {args.symbol.upper()}")
-    print(f"Side:         {args.side.upper()}")
-    print(f"Type:         {args.order_type.upper()}")
+    print(f"Symbol:       {args.symbol}")
+    print(f"Side:         {args.side}")
+    print(f"Type:         {args.order_type}")
     print(f"Quantity:     {args.quantity}")
     if args.price:
         print(f"Price:        {args.price}")
@@ -108,14 +181,40 @@ def main():
     
     parser = create_parser()
     args = parser.parse_args()
-    
+
     logger.info("Starting trading bot")
+
+    if args.batch:
+        orders = parse_batch_file(args.batch)
+        logger.info(f"Batch mode: placing {len(orders)} orders from {args.batch}")
+
+        try:
+            api_key, api_secret = load_config()
+            print(f"Placing {len(orders)} orders concurrently...")
+            ok = asyncio.run(run_batch(orders, api_key, api_secret))
+            sys.exit(0 if ok else 1)
+        except KeyboardInterrupt:
+            print("\nOperation cancelled by user")
+            logger.info("Operation cancelled by user")
+            sys.exit(0)
+        except Exception as e:
+            print(f"\nUnexpected error: {e}")
+            logger.exception("Unexpected error occurred")
+            sys.exit(1)
+
+    if not all((args.symbol, args.side, args.order_type, args.quantity)):
+        parser.error("--symbol, --side, --type and --quantity are required "
+                     "unless --batch is given")
+
     logger.info(f"Order params: symbol={args.symbol}, side={args.side}, "
                 f"type={args.order_type}, qty={args.quantity}, price={args.price}")
     
     print_request_summary(args)
-    
+
     try:
+        from bot.client import BinanceClient
+        from bot.orders import OrderManager
+
         api_key, api_secret = load_config()
         
         print("Connecting to Binance Testnet...")
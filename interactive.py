@@ -7,11 +7,17 @@ Provides a menu-driven interface for placing orders.
 
 import os
 import sys
-from dotenv import load_dotenv
+import time
+from contextlib import closing
+from functools import lru_cache
 
 from bot.logging_config import setup_logging, get_logger
-from bot.client import BinanceClient
-from bot.orders import OrderManager
+
+# dotenv and the client/order modules (which pull in requests and
+# urllib3) are imported lazily in load_config/main, so the banner and
+# early-exit paths don't pay their import cost.
+
+logger = get_logger('interactive')
 
 
 class Colors:
@@ -25,14 +31,28 @@ class Colors:
     RESET = '\033[0m'
 
 
-def colored(text, color):
-    """Wrap text with color codes."""
-    return f"{color}{text}{Colors.RESET}"
+# Color is decided once at startup: piping the output to a file or
+# another program (or setting NO_COLOR) turns colored() into the
+# identity and empties the Colors codes, so the precomputed constants
+# below come out ANSI-free and downstream consumers get clean text.
+_USE_COLOR = sys.stdout.isatty() and not os.getenv('NO_COLOR')
 
+if _USE_COLOR:
+    def colored(text, color):
+        """Wrap text with color codes."""
+        return f"{color}{text}{Colors.RESET}"
+else:
+    for _name in ('GREEN', 'RED', 'YELLOW', 'BLUE', 'CYAN', 'BOLD', 'RESET'):
+        setattr(Colors, _name, '')
 
-def print_banner():
-    """Print welcome banner."""
-    banner = """
+    def colored(text, color):
+        """Color disabled: return the text unchanged."""
+        return text
+
+
+# Static blocks are colored once at import and written with a single
+# syscall per redraw, instead of one print (and one flush) per line.
+_BANNER = colored("""
     ╔══════════════════════════════════════════════════════╗
     ║                                                      ║
     ║   ██████╗ ██╗███╗   ██╗ █████╗ ███╗   ██╗ ██████╗   ║
@@ -45,29 +65,97 @@ def print_banner():
     ║         Futures Testnet Trading Bot                  ║
     ║                                                      ║
     ╚══════════════════════════════════════════════════════╝
+    """, Colors.CYAN)
+
+_MENU_SEP = colored("═" * 50, Colors.BLUE)
+
+_MENU_CACHED = "\n".join((
+    "",
+    _MENU_SEP,
+    colored("  MAIN MENU", Colors.BOLD),
+    _MENU_SEP,
+    f"  {colored('[1]', Colors.GREEN)} Place Market Order",
+    f"  {colored('[2]', Colors.GREEN)} Place Limit Order",
+    f"  {colored('[3]', Colors.GREEN)} View Open Orders",
+    f"  {colored('[4]', Colors.GREEN)} Check Account Balance",
+    f"  {colored('[5]', Colors.GREEN)} Get Current Price",
+    f"  {colored('[0]', Colors.RED)} Exit",
+    _MENU_SEP,
+    "",
+))
+
+# Fixed strings colored once at import; colored() at call sites is kept
+# only for values with runtime-variable content.
+_BOX_TOP = "  ┌─────────────────────────────────────┐"
+_BOX_BOTTOM = "  └─────────────────────────────────────┘"
+_BOX_TOP_YELLOW = colored(_BOX_TOP, Colors.YELLOW)
+_BOX_BOTTOM_YELLOW = colored(_BOX_BOTTOM, Colors.YELLOW)
+_BOX_TOP_GREEN = colored(_BOX_TOP, Colors.GREEN)
+_BOX_BOTTOM_GREEN = colored(_BOX_BOTTOM, Colors.GREEN)
+_BOX_TOP_RED = colored(_BOX_TOP, Colors.RED)
+_BOX_BOTTOM_RED = colored(_BOX_BOTTOM, Colors.RED)
+_BOX_BOTTOM_BLUE = colored("  └─────────────────────────────────────────┘", Colors.BLUE)
+
+# Row templates with the color baked in: one %-format pass per row
+# instead of an f-string plus a colored() wrap.
+_ROW_YELLOW = f"{Colors.YELLOW}  │  %-11s%-22s │{Colors.RESET}"
+_ROW_GREEN = f"{Colors.GREEN}  │  %-11s%-22s │{Colors.RESET}"
+_ROW_BLUE = f"{Colors.BLUE}  │  %-10s%-24s │{Colors.RESET}"
+_ORDER_BOX_TOP_BLUE = f"{Colors.BLUE}  ┌─── Order %s ───────────────────────────┐{Colors.RESET}"
+
+_CONFIRM_HEADER = colored("  │       ORDER CONFIRMATION            │", Colors.YELLOW)
+_CONFIRM_DIVIDER = colored("  ├─────────────────────────────────────┤", Colors.YELLOW)
+_ORDER_OK = colored("  ✓ ORDER PLACED SUCCESSFULLY!", Colors.GREEN)
+_ORDER_FAILED = colored("  ✗ ORDER FAILED!", Colors.RED)
+_SIDE_PROMPT = colored("\n  Side: [B]uy or [S]ell", Colors.CYAN)
+_MIN_ORDER_NOTE = colored("\n  Note: Minimum order value is $100", Colors.CYAN)
+_ORDER_CANCELLED = colored("\n  Order cancelled.", Colors.YELLOW)
+_PLACING_ORDER = colored("\n  Placing order...", Colors.CYAN)
+
+
+def _prompt(msg):
     """
-    print(colored(banner, Colors.CYAN))
+    Read one line of input, writing the prompt straight to stdout.
+
+    Unlike the input() builtin, this performs exactly one stdout write
+    and one flush per prompt — no redundant empty writes or stderr
+    flush. Raises EOFError at end of input, matching input().
+    """
+    sys.stdout.write(msg)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
+_PAUSE_PROMPT = colored("\n  Press Enter to continue...", Colors.CYAN)
+
+
+def _pause():
+    """Wait for Enter between menu actions; a no-op when input is piped."""
+    if sys.stdin.isatty():
+        _prompt(_PAUSE_PROMPT)
+
+
+def print_banner():
+    """Print welcome banner."""
+    sys.stdout.write(_BANNER)
+    sys.stdout.write("\n")
 
 
 def print_menu():
     """Print main menu."""
-    print("\n" + colored("═" * 50, Colors.BLUE))
-    print(colored("  MAIN MENU", Colors.BOLD))
-    print(colored("═" * 50, Colors.BLUE))
-    print(f"  {colored('[1]', Colors.GREEN)} Place Market Order")
-    print(f"  {colored('[2]', Colors.GREEN)} Place Limit Order")
-    print(f"  {colored('[3]', Colors.GREEN)} View Open Orders")
-    print(f"  {colored('[4]', Colors.GREEN)} Check Account Balance")
-    print(f"  {colored('[5]', Colors.GREEN)} Get Current Price")
-    print(f"  {colored('[0]', Colors.RED)} Exit")
-    print(colored("═" * 50, Colors.BLUE))
+    sys.stdout.write(_MENU_CACHED)
+    sys.stdout.flush()
 
 
 def get_input(prompt, validator=None, error_msg="Invalid input"):
     """Get validated input from user."""
+    prompt_str = colored(f"  {prompt}: ", Colors.YELLOW)
     while True:
         try:
-            value = input(colored(f"  {prompt}: ", Colors.YELLOW)).strip()
+            value = _prompt(prompt_str).strip()
             
             if not value:
                 print(colored(f"  ✗ Input cannot be empty", Colors.RED))
@@ -85,20 +173,33 @@ def get_input(prompt, validator=None, error_msg="Invalid input"):
             return None
 
 
+_SIDES = frozenset(('BUY', 'SELL', 'B', 'S'))
+_BUY = frozenset(('BUY', 'B'))
+
+
+# The distinct inputs typed at these prompts are a handful of symbols
+# and sides, so memoizing skips the re-normalization on repeat entries.
+# Invalid inputs raise and are never cached. The float validators stay
+# uncached: parsing is cheaper than hashing the cache key.
+@lru_cache(maxsize=64)
 def validate_symbol(value):
     """Validate trading symbol."""
     value = value.upper().strip()
     if not value.endswith('USDT'):
         raise ValueError("Symbol must end with USDT (e.g., BTCUSDT)")
-    return value
+    # Interned so the symbol compares by pointer in the dict lookups and
+    # equality checks downstream; lru_cache means this runs once per
+    # distinct input.
+    return sys.intern(value)
 
 
+@lru_cache(maxsize=64)
 def validate_side(value):
     """Validate order side."""
     value = value.upper().strip()
-    if value not in ['BUY', 'SELL', 'B', 'S']:
+    if value not in _SIDES:
         raise ValueError("Must be BUY/B or SELL/S")
-    return 'BUY' if value in ['BUY', 'B'] else 'SELL'
+    return sys.intern('BUY' if value in _BUY else 'SELL')
 
 
 def validate_quantity(value):
@@ -119,44 +220,67 @@ def validate_price(value):
 
 def confirm_order(symbol, side, order_type, quantity, price=None):
     """Show order confirmation prompt."""
-    print("\n" + colored("  ┌─────────────────────────────────────┐", Colors.YELLOW))
-    print(colored("  │       ORDER CONFIRMATION            │", Colors.YELLOW))
-    print(colored("  ├─────────────────────────────────────┤", Colors.YELLOW))
-    print(colored(f"  │  Symbol:    {symbol:<22} │", Colors.YELLOW))
-    print(colored(f"  │  Side:      {side:<22} │", Colors.YELLOW))
-    print(colored(f"  │  Type:      {order_type:<22} │", Colors.YELLOW))
-    print(colored(f"  │  Quantity:  {quantity:<22} │", Colors.YELLOW))
+    lines = [
+        "",
+        _BOX_TOP_YELLOW,
+        _CONFIRM_HEADER,
+        _CONFIRM_DIVIDER,
+        _ROW_YELLOW % ("Symbol:", symbol),
+        _ROW_YELLOW % ("Side:", side),
+        _ROW_YELLOW % ("Type:", order_type),
+        _ROW_YELLOW % ("Quantity:", quantity),
+    ]
     if price:
-        print(colored(f"  │  Price:     {price:<22} │", Colors.YELLOW))
-    print(colored("  └─────────────────────────────────────┘", Colors.YELLOW))
-    
-    confirm = input(colored("\n  Confirm order? (y/n): ", Colors.BOLD)).strip().lower()
+        lines.append(_ROW_YELLOW % ("Price:", price))
+    lines.append(_BOX_BOTTOM_YELLOW)
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.flush()
+
+    confirm = _prompt(colored("\n  Confirm order? (y/n): ", Colors.BOLD)).strip().lower()
     return confirm in ['y', 'yes']
 
 
 def print_result(result, order_manager):
     """Print order result with formatting."""
-    if result.get('success'):
-        print("\n" + colored("  ✓ ORDER PLACED SUCCESSFULLY!", Colors.GREEN))
-        print(colored("  ┌─────────────────────────────────────┐", Colors.GREEN))
-        print(colored(f"  │  Order ID:  {result.get('order_id'):<22} │", Colors.GREEN))
-        print(colored(f"  │  Status:    {result.get('status'):<22} │", Colors.GREEN))
-        print(colored(f"  │  Symbol:    {result.get('symbol'):<22} │", Colors.GREEN))
-        print(colored(f"  │  Side:      {result.get('side'):<22} │", Colors.GREEN))
-        print(colored(f"  │  Type:      {result.get('type'):<22} │", Colors.GREEN))
-        print(colored(f"  │  Quantity:  {result.get('quantity'):<22} │", Colors.GREEN))
-        if result.get('price') and result.get('price') != '0':
-            print(colored(f"  │  Price:     {result.get('price'):<22} │", Colors.GREEN))
-        if result.get('avg_price') and result.get('avg_price') != '0.00':
-            print(colored(f"  │  Avg Price: {result.get('avg_price'):<22} │", Colors.GREEN))
-        print(colored("  └─────────────────────────────────────┘", Colors.GREEN))
+    # One bound .get plus locals for the re-tested fields: every row is
+    # a LOAD_FAST instead of a fresh dict probe + method dispatch.
+    get = result.get
+
+    if get('success'):
+        price = get('price')
+        avg_price = get('avg_price')
+        lines = [
+            "",
+            _ORDER_OK,
+            _BOX_TOP_GREEN,
+            _ROW_GREEN % ("Order ID:", get('order_id')),
+            _ROW_GREEN % ("Status:", get('status')),
+            _ROW_GREEN % ("Symbol:", get('symbol')),
+            _ROW_GREEN % ("Side:", get('side')),
+            _ROW_GREEN % ("Type:", get('type')),
+            _ROW_GREEN % ("Quantity:", get('quantity')),
+        ]
+        if price and price != '0':
+            lines.append(_ROW_GREEN % ("Price:", price))
+        if avg_price and avg_price != '0.00':
+            lines.append(_ROW_GREEN % ("Avg Price:", avg_price))
+        lines.append(_BOX_BOTTOM_GREEN)
     else:
-        print("\n" + colored("  ✗ ORDER FAILED!", Colors.RED))
-        print(colored("  ┌─────────────────────────────────────┐", Colors.RED))
-        if result.get('error_code'):
-            print(colored(f"  │  Error Code: {result.get('error_code'):<21} │", Colors.RED))
-        print(colored(f"  │  {result.get('error')[:35]:<35} │", Colors.RED))
-        print(colored("  └─────────────────────────────────────┘", Colors.RED))
+        error_code = get('error_code')
+        lines = [
+            "",
+            _ORDER_FAILED,
+            _BOX_TOP_RED,
+        ]
+        if error_code:
+            lines.append(colored(f"  │  Error Code: {str(error_code).ljust(21)} │", Colors.RED))
+        lines.append(colored(f"  │  {get('error')[:35].ljust(35)} │", Colors.RED))
+        lines.append(_BOX_BOTTOM_RED)
+
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.flush()
 
 
 def place_market_order(order_manager):
@@ -168,21 +292,21 @@ def place_market_order(order_manager):
     if not symbol:
         return
     
-    print(colored("\n  Side: [B]uy or [S]ell", Colors.CYAN))
+    print(_SIDE_PROMPT)
     side = get_input("Enter side", validate_side, "Invalid side")
     if not side:
         return
     
-    print(colored("\n  Note: Minimum order value is $100", Colors.CYAN))
+    print(_MIN_ORDER_NOTE)
     quantity = get_input("Enter quantity", validate_quantity, "Invalid quantity")
     if not quantity:
         return
     
     if not confirm_order(symbol, side, 'MARKET', quantity):
-        print(colored("\n  Order cancelled.", Colors.YELLOW))
+        print(_ORDER_CANCELLED)
         return
     
-    print(colored("\n  Placing order...", Colors.CYAN))
+    print(_PLACING_ORDER)
     result = order_manager.place_order(symbol, side, 'MARKET', quantity)
     print_result(result, order_manager)
 
@@ -196,12 +320,12 @@ def place_limit_order(order_manager):
     if not symbol:
         return
     
-    print(colored("\n  Side: [B]uy or [S]ell", Colors.CYAN))
+    print(_SIDE_PROMPT)
     side = get_input("Enter side", validate_side, "Invalid side")
     if not side:
         return
     
-    print(colored("\n  Note: Minimum order value is $100", Colors.CYAN))
+    print(_MIN_ORDER_NOTE)
     quantity = get_input("Enter quantity", validate_quantity, "Invalid quantity")
     if not quantity:
         return
@@ -216,10 +340,10 @@ def place_limit_order(order_manager):
         return
     
     if not confirm_order(symbol, side, 'LIMIT', quantity, price):
-        print(colored("\n  Order cancelled.", Colors.YELLOW))
+        print(_ORDER_CANCELLED)
         return
     
-    print(colored("\n  Placing order...", Colors.CYAN))
+    print(_PLACING_ORDER)
     result = order_manager.place_order(symbol, side, 'LIMIT', quantity, price)
     print_result(result, order_manager)
 
@@ -228,7 +352,7 @@ def view_open_orders(order_manager):
     """View all open orders."""
     print("\n" + colored("  ── OPEN ORDERS ──", Colors.BOLD))
     
-    symbol = input(colored("  Enter symbol (or press Enter for all): ", Colors.YELLOW)).strip()
+    symbol = _prompt(colored("  Enter symbol (or press Enter for all): ", Colors.YELLOW)).strip()
     symbol = symbol.upper() if symbol else None
     
     print(colored("\n  Fetching orders...", Colors.CYAN))
@@ -246,16 +370,21 @@ def view_open_orders(order_manager):
     
     print(colored(f"\n  Found {len(orders)} open order(s):\n", Colors.GREEN))
     
+    lines = []
     for i, order in enumerate(orders, 1):
-        print(colored(f"  ┌─── Order {i} ───────────────────────────┐", Colors.BLUE))
-        print(colored(f"  │  ID:       {order.get('orderId'):<24} │", Colors.BLUE))
-        print(colored(f"  │  Symbol:   {order.get('symbol'):<24} │", Colors.BLUE))
-        print(colored(f"  │  Side:     {order.get('side'):<24} │", Colors.BLUE))
-        print(colored(f"  │  Type:     {order.get('type'):<24} │", Colors.BLUE))
-        print(colored(f"  │  Price:    {order.get('price'):<24} │", Colors.BLUE))
-        print(colored(f"  │  Quantity: {order.get('origQty'):<24} │", Colors.BLUE))
-        print(colored(f"  │  Status:   {order.get('status'):<24} │", Colors.BLUE))
-        print(colored(f"  └─────────────────────────────────────────┘", Colors.BLUE))
+        get = order.get
+        lines.append(_ORDER_BOX_TOP_BLUE % i)
+        lines.append(_ROW_BLUE % ("ID:", get('orderId')))
+        lines.append(_ROW_BLUE % ("Symbol:", get('symbol')))
+        lines.append(_ROW_BLUE % ("Side:", get('side')))
+        lines.append(_ROW_BLUE % ("Type:", get('type')))
+        lines.append(_ROW_BLUE % ("Price:", get('price')))
+        lines.append(_ROW_BLUE % ("Quantity:", get('origQty')))
+        lines.append(_ROW_BLUE % ("Status:", get('status')))
+        lines.append(_BOX_BOTTOM_BLUE)
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.flush()
 
 
 def check_balance(client):
@@ -266,7 +395,7 @@ def check_balance(client):
     try:
         account = client.get_account_info()
         
-        print(colored("\n  ┌─────────────────────────────────────┐", Colors.GREEN))
+        print("\n" + _BOX_TOP_GREEN)
         print(colored("  │         ACCOUNT SUMMARY             │", Colors.GREEN))
         print(colored("  ├─────────────────────────────────────┤", Colors.GREEN))
         
@@ -274,35 +403,50 @@ def check_balance(client):
         available = float(account.get('availableBalance', 0))
         unrealized_pnl = float(account.get('totalUnrealizedProfit', 0))
         
-        print(colored(f"  │  Total Balance:    ${total_balance:>14,.2f} │", Colors.GREEN))
-        print(colored(f"  │  Available:        ${available:>14,.2f} │", Colors.GREEN))
-        
+        total_str = format(total_balance, ',.2f').rjust(14)
+        available_str = format(available, ',.2f').rjust(14)
+        print(colored(f"  │  Total Balance:    ${total_str} │", Colors.GREEN))
+        print(colored(f"  │  Available:        ${available_str} │", Colors.GREEN))
+
         pnl_color = Colors.GREEN if unrealized_pnl >= 0 else Colors.RED
-        pnl_str = f"${unrealized_pnl:>14,.2f}"
+        pnl_str = "$" + format(unrealized_pnl, ',.2f').rjust(14)
         print(f"  │  Unrealized PnL:   {colored(pnl_str, pnl_color)} │")
         
-        print(colored("  └─────────────────────────────────────┘", Colors.GREEN))
+        print(_BOX_BOTTOM_GREEN)
         
     except Exception as e:
         print(colored(f"\n  ✗ Error fetching balance: {e}", Colors.RED))
 
 
+# symbol -> (monotonic timestamp, price). The client's _cached_get
+# already deduplicates calls inside its 1-second PRICE_TTL; this longer
+# window covers re-checking the same symbol across menu round-trips
+# without another network hit.
+_PRICE_CACHE: dict[str, tuple[float, float]] = {}
+_PRICE_CACHE_TTL = float(os.getenv('PRICE_CACHE_TTL', '2.0'))
+
+
 def get_price(client):
     """Get current price for a symbol."""
     print("\n" + colored("  ── CURRENT PRICE ──", Colors.BOLD))
-    
+
     symbol = get_input("Enter symbol (e.g., BTCUSDT)", validate_symbol, "Invalid symbol")
     if not symbol:
         return
-    
+
     print(colored("\n  Fetching price...", Colors.CYAN))
-    
+
     try:
-        data = client.get_symbol_price(symbol)
-        price = float(data.get('price', 0))
-        
+        now = time.monotonic()
+        ts, price = _PRICE_CACHE.get(symbol, (0.0, 0.0))
+        if now - ts >= _PRICE_CACHE_TTL:
+            data = client.get_symbol_price(symbol)
+            price = float(data.get('price', 0))
+            _PRICE_CACHE[symbol] = (now, price)
+
         print(colored(f"\n  ┌─────────────────────────────────────┐", Colors.GREEN))
-        print(colored(f"  │  {symbol:<12} ${price:>18,.2f}   │", Colors.GREEN))
+        price_str = format(price, ',.2f').rjust(18)
+        print(colored(f"  │  {symbol.ljust(12)} ${price_str}   │", Colors.GREEN))
         print(colored(f"  └─────────────────────────────────────┘", Colors.GREEN))
         
     except Exception as e:
@@ -311,6 +455,8 @@ def get_price(client):
 
 def load_config():
     """Load API credentials."""
+    from dotenv import load_dotenv
+
     load_dotenv()
     
     api_key = os.getenv('BINANCE_TESTNET_API_KEY')
@@ -327,49 +473,55 @@ def load_config():
 
 def main():
     """Main interactive loop."""
-    setup_logging()
-    logger = get_logger('interactive')
-    
+    # Guarded so repeated main() entries (test harnesses, REPL reuse)
+    # don't re-run handler configuration.
+    if not getattr(main, '_logging_ready', False):
+        setup_logging()
+        main._logging_ready = True
+
     print_banner()
     
     print(colored("  Connecting to Binance Testnet...", Colors.CYAN))
     
     try:
+        from bot.client import BinanceClient
+        from bot.orders import OrderManager
+
         api_key, api_secret = load_config()
-        client = BinanceClient(api_key, api_secret)
-        
-        if not client.test_connectivity():
-            print(colored("  ✗ Could not connect to Binance API", Colors.RED))
-            sys.exit(1)
-        
-        print(colored("  ✓ Connected successfully!", Colors.GREEN))
-        logger.info("Interactive CLI started")
-        
-        order_manager = OrderManager(client)
-        
-        while True:
-            print_menu()
-            
-            choice = input(colored("  Select option: ", Colors.BOLD)).strip()
-            
-            if choice == '1':
-                place_market_order(order_manager)
-            elif choice == '2':
-                place_limit_order(order_manager)
-            elif choice == '3':
-                view_open_orders(order_manager)
-            elif choice == '4':
-                check_balance(client)
-            elif choice == '5':
-                get_price(client)
-            elif choice == '0':
-                print(colored("\n  Goodbye! Happy trading!\n", Colors.CYAN))
-                logger.info("Interactive CLI closed")
-                break
-            else:
-                print(colored("\n  ✗ Invalid option. Please try again.", Colors.RED))
-            
-            input(colored("\n  Press Enter to continue...", Colors.CYAN))
+        with closing(BinanceClient(api_key, api_secret)) as client:
+            if not client.test_connectivity():
+                print(colored("  ✗ Could not connect to Binance API", Colors.RED))
+                sys.exit(1)
+
+            print(colored("  ✓ Connected successfully!", Colors.GREEN))
+            logger.info("Interactive CLI started")
+
+            order_manager = OrderManager(client)
+
+            actions = {
+                '1': lambda: place_market_order(order_manager),
+                '2': lambda: place_limit_order(order_manager),
+                '3': lambda: view_open_orders(order_manager),
+                '4': lambda: check_balance(client),
+                '5': lambda: get_price(client),
+            }
+
+            while True:
+                print_menu()
+
+                choice = _prompt(colored("  Select option: ", Colors.BOLD)).strip()
+
+                action = actions.get(choice)
+                if action:
+                    action()
+                elif choice == '0':
+                    print(colored("\n  Goodbye! Happy trading!\n", Colors.CYAN))
+                    logger.info("Interactive CLI closed")
+                    break
+                else:
+                    print(colored("\n  ✗ Invalid option. Please try again.", Colors.RED))
+
+                _pause()
     
     except KeyboardInterrupt:
         print(colored("\n\n  Goodbye!\n", Colors.CYAN))